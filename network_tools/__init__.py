@@ -12,8 +12,6 @@ efficient network operations.
 
 from __future__ import annotations
 
-from importlib.metadata import version
-
 from .cli import (
     complete_progress,
     console,
@@ -33,4 +31,24 @@ __all__ = [
     "parse_args",
     "update_progress",
 ]
-__version__ = version("network_tools")
+
+
+def __getattr__(name: str) -> str:
+    """Resolve the package version on first access.
+
+    This keeps importlib.metadata and its distribution lookup off the import path for
+    callers that never ask for the version.
+
+    Returns:
+        The installed version of network_tools
+
+    Raises:
+        AttributeError: If the requested attribute does not exist
+    """
+    if name == "__version__":
+        from importlib.metadata import version  # noqa: PLC0415
+
+        globals()["__version__"] = package_version = version("network_tools")
+        return package_version
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
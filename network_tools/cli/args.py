@@ -12,7 +12,6 @@ from argparse import (
     Namespace as Arguments,
     RawDescriptionHelpFormatter as Formatter,
 )
-from importlib.metadata import version
 from sys import argv as sys_argv, exit as sys_exit
 
 from network_tools.constants import (
@@ -31,6 +30,9 @@ def parse_args() -> Arguments:
     Returns:
         Configured arguments instance
     """
+    # Only needed here, so keep importlib.metadata out of the package import
+    from importlib.metadata import version  # noqa: PLC0415
+
     # Create the parser
     parser = ArgumentParser(
         description=CLI_HELP_DESCRIPTION,
@@ -12,8 +12,6 @@ from __future__ import annotations
 
 from asyncio import (
     CancelledError as AsyncioCancelledError,
-    StreamReader,
-    StreamWriter,
     create_task as asyncio_create_task,
     get_event_loop as asyncio_get_event_loop,
     open_connection,
@@ -23,13 +21,28 @@ from asyncio import (
 )
 from contextlib import suppress as contextlib_suppress
 from dataclasses import dataclass, field
-from re import compile as re_compile, error as re_error
-from typing import Any, ClassVar, Self
+from functools import lru_cache
+from re import compile as re_compile, error as re_error, escape as re_escape
+from typing import TYPE_CHECKING, Any, ClassVar, Self
 
 from network_tools.cli import log
 
 from .negotiate import TelnetNegotiator
-from .types import IAC_BYTE
+from .types import ESCAPED_IAC, IAC
+
+if TYPE_CHECKING:
+    from asyncio import StreamReader, StreamWriter
+    from re import Pattern
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(expected: bytes) -> Pattern[bytes]:
+    """Compile a read_until pattern once, reusing it for later calls with the same bytes.
+
+    Returns:
+        The compiled bytes pattern
+    """
+    return re_compile(expected)
 
 
 @dataclass(slots=True)
@@ -179,10 +192,8 @@ class AsyncTelnetClient:
         if not self.reader or not self.writer:
             return
 
-        # Give the server a moment to send initial negotiations
-        await asyncio_sleep(0.1)
-
-        # Try to read initial negotiation data
+        # Read initial negotiation data as soon as it arrives - anything the server sends
+        # later is still handled by _process_negotiation on each subsequent read
         try:
             data = await asyncio_wait_for(self.reader.read(1024), timeout=1.0)
             if data:
@@ -241,12 +252,15 @@ class AsyncTelnetClient:
     async def read_until(self, expected: bytes, time_limit: float | None = None) -> bytes:
         """Read data until a specific pattern is found.
 
+        The pattern is a bytes regex searched in place in the receive buffer. A pattern
+        with no regex special characters can only match len(expected) bytes, so for those
+        just the new chunk and enough preceding bytes to straddle the boundary are scanned.
+
         Returns:
             All data read including the expected pattern
 
         Raises:
             TimeoutError: If the pattern is not found within the timeout
-            UnicodeDecodeError: If the pattern cannot be decoded
             re.error: If the pattern is not a valid regex
         """
         if not self.reader:
@@ -260,15 +274,16 @@ class AsyncTelnetClient:
         view = memoryview(buffer)
         pos = 0
 
-        # Compile the regex pattern once if using regex mode
-        pattern = None
+        # Compiled patterns are cached, so repeated prompts skip compilation entirely
         try:
-            decoded = expected.decode("utf-8", errors="replace")
-            pattern = re_compile(decoded)
-        except (re_error, UnicodeDecodeError):
+            pattern = _compile_pattern(expected)
+        except re_error:
             log.warning("Failed to compile regex pattern: %r", expected)
             raise
 
+        # Only a literal has a known match length - a regex match could start anywhere
+        lookback = len(expected) - 1 if re_escape(expected) == expected else None
+
         start_time = asyncio_get_event_loop().time()
         end_time = start_time + time_limit
 
@@ -282,22 +297,21 @@ class AsyncTelnetClient:
 
             # Ensure buffer has enough space
             if pos + len(chunk) > len(buffer):
-                # Double buffer size when needed
-                new_buffer = bytearray(len(buffer) * 2)
-                new_buffer[:pos] = buffer[:pos]
+                # Double buffer size (or more for large chunks) when needed
+                new_buffer = bytearray(max(len(buffer) * 2, pos + len(chunk)))
+                new_buffer[:pos] = view[:pos]
                 buffer = new_buffer
                 view = memoryview(buffer)
 
+            chunk_start = pos
             view[pos : pos + len(chunk)] = chunk
             pos += len(chunk)
 
-            # Check for pattern match
-            current_buffer = bytes(buffer[:pos])
-
-            # Use regex pattern matching
-            text_to_search = current_buffer.decode("utf-8", errors="replace")
-            if pattern.search(text_to_search):
-                return current_buffer
+            # Earlier data has already been searched, so a literal only needs rescanning
+            # from as far back as a match ending in the new chunk could start
+            search_start = 0 if lookback is None else max(0, chunk_start - lookback)
+            if pattern.search(buffer, search_start, pos):
+                return bytes(view[:pos])
 
         msg = f"Timeout waiting for {expected!r}"
         raise TimeoutError(msg)
@@ -318,35 +332,12 @@ class AsyncTelnetClient:
         return await self.read_until(prompt, time_limit)
 
     async def write(self, data: bytes) -> None:
-        """Write data to telnet connection with optimised IAC escaping."""
+        """Write data to telnet connection, escaping any IAC bytes."""
         if not self.writer:
             return
 
-        # Fast path for common case - no IAC bytes
-        if IAC_BYTE not in data:
-            self.writer.write(data)
-            await self.writer.drain()
-            return
-
-        # Pre-calculate exact size needed
-        iac_count = data.count(IAC_BYTE)
-        escaped_data = bytearray(len(data) + iac_count)
-
-        # Use memoryview for more efficient buffer manipulation
-        view = memoryview(escaped_data)
-        i = j = 0
-
-        # Single-pass escape using memoryview
-        while i < len(data):
-            b = data[i]
-            view[j] = b
-            if b == IAC_BYTE:
-                j += 1
-                view[j] = IAC_BYTE
-            i += 1
-            j += 1
-
-        self.writer.write(escaped_data)
+        # Double every IAC byte in a single pass - data is returned as-is if it has none
+        self.writer.write(data.replace(IAC, ESCAPED_IAC))
         await self.writer.drain()
 
     async def send_command(self, command: str, newline: str = "\r\n") -> None:
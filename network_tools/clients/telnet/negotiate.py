@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from .types import NegotiationResponse, ParserState, TelnetCommand, TelnetOption, TelnetSequence
+from .types import IAC, NegotiationResponse, ParserState, TelnetCommand, TelnetOption, TelnetSequence
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -45,6 +45,10 @@ class TelnetNegotiator:
         if not data:
             return b"", []
 
+        # Most reads are plain data, which needs no parsing at all
+        if IAC not in data:
+            return bytes(data), []
+
         processed = bytearray()
         responses = []
 
@@ -55,7 +59,20 @@ class TelnetNegotiator:
         subneg_option = 0
         subneg_data = bytearray()
 
-        for byte in data:
+        pos = 0
+        end = len(data)
+        while pos < end:
+            if state == ParserState.DATA:
+                # Copy plain data up to the next IAC in one slice rather than byte by byte
+                next_iac = data.find(IAC, pos)
+                if next_iac == -1:
+                    processed += data[pos:]
+                    break
+                processed += data[pos:next_iac]
+                pos = next_iac
+
+            byte = data[pos]
+            pos += 1
             state, cmd, opt, subneg_option, subneg_data, response = self._process_byte(
                 byte, state, cmd, opt, subneg_option, subneg_data
             )
@@ -264,12 +281,8 @@ class TelnetNegotiator:
         Returns:
             True if we should accept the option, False otherwise
         """
-        # We accept common options
-        if option in TelnetOption.get_common_options():
-            return True
-
-        # We accept advanced options we specifically support
-        return bool(option in TelnetOption.get_advanced_options())
+        # We accept common options and advanced options we specifically support
+        return TelnetOption.is_supported(option)
 
     def _update_option_state(self, option: int, cmd: int, enabled: bool) -> None:
         """Update the option state based on the command.
@@ -6,6 +6,8 @@ from enum import IntEnum
 from typing import NamedTuple
 
 IAC_BYTE = 0xFF  # Interpret As Command byte
+IAC = bytes((IAC_BYTE,))  # IAC as a bytes object, for searching and replacing
+ESCAPED_IAC = IAC * 2  # A literal 255 data byte is sent as IAC IAC
 
 
 class ParserState(IntEnum):
@@ -36,7 +38,7 @@ class TelnetCommand(IntEnum):
         Returns:
             True if the command is a negotiation command, False otherwise
         """
-        return cmd in {cls.DO, cls.DONT, cls.WILL, cls.WONT}
+        return cmd in _NEGOTIATION_COMMANDS
 
     @classmethod
     def get_response_command(cls, cmd: int) -> int:
@@ -45,12 +47,22 @@ class TelnetCommand(IntEnum):
         Returns:
             The appropriate response command
         """
-        return {
-            cls.DO: cls.WILL,  # Respond to DO with WILL
-            cls.DONT: cls.WONT,  # Respond to DONT with WONT
-            cls.WILL: cls.DO,  # Respond to WILL with DO
-            cls.WONT: cls.DONT,  # Respond to WONT with DONT
-        }.get(cmd, 0)
+        return _RESPONSE_COMMANDS.get(cmd, 0)
+
+
+# Lookup tables built once at import rather than on every call
+_NEGOTIATION_COMMANDS = frozenset({
+    TelnetCommand.DO,
+    TelnetCommand.DONT,
+    TelnetCommand.WILL,
+    TelnetCommand.WONT,
+})
+_RESPONSE_COMMANDS = {
+    TelnetCommand.DO: TelnetCommand.WILL,  # Respond to DO with WILL
+    TelnetCommand.DONT: TelnetCommand.WONT,  # Respond to DONT with WONT
+    TelnetCommand.WILL: TelnetCommand.DO,  # Respond to WILL with DO
+    TelnetCommand.WONT: TelnetCommand.DONT,  # Respond to WONT with DONT
+}
 
 
 class TelnetOption(IntEnum):
@@ -74,13 +86,7 @@ class TelnetOption(IntEnum):
         Returns:
             True if the option is supported, False otherwise
         """
-        return option in {
-            cls.BINARY,
-            cls.ECHO,
-            cls.SGA,
-            cls.TERMINAL_TYPE,
-            cls.NAWS,
-        }
+        return option in _SUPPORTED_OPTIONS
 
     @classmethod
     def get_common_options(cls) -> list[int]:
@@ -101,6 +107,11 @@ class TelnetOption(IntEnum):
         return [cls.TERMINAL_TYPE, cls.NAWS]
 
 
+# Supported options built once at import from the common and advanced lists, so the
+# lists stay the one place to change what we support
+_SUPPORTED_OPTIONS = frozenset(TelnetOption.get_common_options() + TelnetOption.get_advanced_options())
+
+
 class TelnetSequence(NamedTuple):
     """Represents a complete telnet command sequence."""
 
@@ -6,21 +6,28 @@ concurrently, with configurable timeouts and concurrency limits.
 
 from __future__ import annotations
 
+from array import array
 from asyncio import (
-    Semaphore,
     gather as asyncio_gather,
-    get_event_loop as asyncio_get_event_loop,
     open_connection as asyncio_open_connection,
     wait_for as asyncio_wait_for,
 )
 from dataclasses import dataclass
+from itertools import product
 from socket import gaierror as socket_gaierror
-from typing import Any
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Self, cast
 
 from network_tools.cli.console import complete_progress, create_progress, log, update_progress
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-@dataclass
+# Highest valid TCP port, which is also the most the unsigned short ports column holds
+_MAX_PORT = 65535
+
+
+@dataclass(slots=True)
 class ConnectionResult:
     """Result of a TCP connection attempt."""
 
@@ -45,6 +52,88 @@ class ConnectionResult:
         }
 
 
+@dataclass(slots=True)
+class ConnectionColumns:
+    """Results of many TCP connection attempts, stored as one array per field.
+
+    Each attempt occupies one position across every column, so a scan of millions of
+    attempts costs a few bytes per result instead of a full object each. Hosts are
+    kept by reference, so repeated hosts share one string.
+    """
+
+    hosts: list[str]
+    ports: array[int]
+    success: array[int]
+    time_ms: array[float]
+    errors: list[str | None]
+
+    @classmethod
+    def allocate(cls, size: int) -> Self:
+        """Create empty columns with room for size results.
+
+        Returns:
+            ConnectionColumns with every position zeroed
+        """
+        return cls(
+            hosts=[""] * size,
+            ports=array("H", [0]) * size,
+            success=array("B", [0]) * size,
+            time_ms=array("d", [0.0]) * size,
+            errors=[None] * size,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of results held."""
+        return len(self.hosts)
+
+    def __getitem__(self, index: int) -> ConnectionResult:
+        """Return the result at index as a ConnectionResult."""
+        return ConnectionResult(
+            host=self.hosts[index],
+            port=self.ports[index],
+            success=bool(self.success[index]),
+            time_ms=round(self.time_ms[index], 2),
+            error=self.errors[index],
+        )
+
+    def store(self, index: int, result: ConnectionResult) -> None:
+        """Store a result at index, splitting it across the columns.
+
+        Args:
+            index: Position to store the result at
+            result: The connection result to store
+        """
+        self.hosts[index] = result.host
+        self.ports[index] = result.port
+        self.success[index] = result.success
+        self.time_ms[index] = result.time_ms
+        self.errors[index] = result.error
+
+    def as_dict(self, index: int) -> dict[str, Any]:
+        """Convert the result at index to a dictionary.
+
+        Returns:
+            Dictionary representation of the result, matching ConnectionResult.as_dict
+        """
+        return self[index].as_dict()
+
+
+def _failure(host: str, port: int, start_time: float, error: str) -> ConnectionResult:
+    """Build a failed ConnectionResult timed from start_time.
+
+    Args:
+        host: The hostname or IP address that was tried
+        port: The TCP port that was tried
+        start_time: perf_counter value taken before the attempt started
+        error: Description of why the attempt failed
+
+    Returns:
+        ConnectionResult marked as unsuccessful
+    """
+    elapsed_ms = (perf_counter() - start_time) * 1000
+    return ConnectionResult(host=host, port=port, success=False, time_ms=round(elapsed_ms, 2), error=error)
+
+
 async def try_connect(host: str, port: int, time_limit: float) -> ConnectionResult:
     """Attempt to connect to a single host and port.
 
@@ -56,14 +145,14 @@ async def try_connect(host: str, port: int, time_limit: float) -> ConnectionResu
     Returns:
         ConnectionResult with connection details
     """
-    start_time = asyncio_get_event_loop().time()
+    start_time = perf_counter()
 
     try:
         # Create socket object
         _reader, writer = await asyncio_wait_for(asyncio_open_connection(host, port), timeout=time_limit)
 
         # If we get here, connection was successful
-        elapsed_ms = (asyncio_get_event_loop().time() - start_time) * 1000
+        elapsed_ms = (perf_counter() - start_time) * 1000
 
         # Properly close the connection
         writer.close()
@@ -72,54 +161,47 @@ async def try_connect(host: str, port: int, time_limit: float) -> ConnectionResu
         return ConnectionResult(host=host, port=port, success=True, time_ms=round(elapsed_ms, 2))
 
     except TimeoutError:
-        elapsed_ms = (asyncio_get_event_loop().time() - start_time) * 1000
-        return ConnectionResult(
-            host=host, port=port, success=False, time_ms=round(elapsed_ms, 2), error="Connection timed out"
-        )
-
+        return _failure(host, port, start_time, "Connection timed out")
     except socket_gaierror as e:
-        elapsed_ms = (asyncio_get_event_loop().time() - start_time) * 1000
-        return ConnectionResult(
-            host=host,
-            port=port,
-            success=False,
-            time_ms=round(elapsed_ms, 2),
-            error=f"DNS resolution error: {e!s}",
-        )
-
+        return _failure(host, port, start_time, f"DNS resolution error: {e!s}")
     except OSError as e:
-        elapsed_ms = (asyncio_get_event_loop().time() - start_time) * 1000
-        return ConnectionResult(
-            host=host, port=port, success=False, time_ms=round(elapsed_ms, 2), error=str(e)
-        )
-
+        return _failure(host, port, start_time, str(e))
     except Exception as e:
-        elapsed_ms = (asyncio_get_event_loop().time() - start_time) * 1000
-        return ConnectionResult(
-            host=host,
-            port=port,
-            success=False,
-            time_ms=round(elapsed_ms, 2),
-            error=f"Unexpected error: {e!s}",
-        )
+        return _failure(host, port, start_time, f"Unexpected error: {e!s}")
 
 
-async def test_connections(
-    hosts: list[str], ports: list[int], time_limit: float, max_concurrency: int
-) -> list[ConnectionResult]:
-    """Test TCP connectivity to multiple hosts and ports concurrently.
+async def _run_connections(
+    hosts: list[str],
+    ports: list[int],
+    time_limit: float,
+    max_concurrency: int,
+    store: Callable[[int, ConnectionResult], object],
+) -> None:
+    """Run connection attempts for every host/port pair, passing each result to store.
+
+    Results are stored by their position in host-major order, so callers can write them
+    straight into pre-allocated storage regardless of the order attempts complete in.
 
     Args:
         hosts: List of hostnames or IP addresses to test
         ports: List of TCP ports to test on each host
-        time_limit: Connection timeout in seconds (default: 10.0)
-        max_concurrency: Maximum number of concurrent connections (default: 50)
+        time_limit: Connection timeout in seconds
+        max_concurrency: Maximum number of concurrent connections
+        store: Callback receiving the index and result of each attempt
 
-    Returns:
-        List of ConnectionResult objects for each connection attempt
+    Raises:
+        ValueError: If max_concurrency is less than 1, or any port is out of range.
     """
-    # Create a semaphore to limit concurrency
-    semaphore = Semaphore(max_concurrency)
+    # With no workers nothing would ever be tested or stored
+    if max_concurrency < 1:
+        msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+        raise ValueError(msg)
+
+    # Checked before any attempt starts, so both result layouts reject a bad port the same way
+    invalid_ports = [port for port in ports if not 1 <= port <= _MAX_PORT]
+    if invalid_ports:
+        msg = f"Ports must be between 1 and {_MAX_PORT}, got {invalid_ports}"
+        raise ValueError(msg)
 
     # Calculate total number of connection attempts
     total_tests = len(hosts) * len(ports)
@@ -127,28 +209,70 @@ async def test_connections(
     # Create a progress bar
     task_id = create_progress(f"Testing {total_tests} connections", total=total_tests)
 
-    # Create tasks for each host/port combination
-    async def connection_task(host: str, port: int) -> ConnectionResult:
-        async with semaphore:
+    # Host/port pairs are generated lazily and shared by every worker, so only
+    # max_concurrency coroutines exist at once instead of one per pair
+    pending = enumerate(product(hosts, ports))
+
+    async def connection_worker() -> None:
+        for index, (host, port) in pending:
             log.debug(f"Testing connection to {host}:{port}")
             result = await try_connect(host, port, time_limit)
+            store(index, result)
 
             # Update progress bar
             status = "✓" if result.success else "✗"
             update_progress(task_id, advance=1, description=f"Testing connections: {host}:{port} {status}")
 
-            return result
-
-    tasks = [connection_task(host, port) for host in hosts for port in ports]
+    workers = [connection_worker() for _ in range(min(max_concurrency, total_tests))]
 
     try:
-        # Run all tasks concurrently and collect results
-        results = await asyncio_gather(*tasks)
+        # Run the workers concurrently until every pair has been tested
+        await asyncio_gather(*workers)
         # Complete the progress bar
         complete_progress(task_id, f"Completed {total_tests} connection tests")
     except Exception as e:
         log.error(f"Error testing connections: {e!s}")
         complete_progress(task_id, "Connection testing failed")
         raise
-    else:
-        return results
+
+
+async def test_connections(
+    hosts: list[str], ports: list[int], time_limit: float, max_concurrency: int
+) -> list[ConnectionResult]:
+    """Test TCP connectivity to multiple hosts and ports concurrently.
+
+    Args:
+        hosts: List of hostnames or IP addresses to test
+        ports: List of TCP ports to test on each host
+        time_limit: Connection timeout in seconds
+        max_concurrency: Maximum number of concurrent connections
+
+    Returns:
+        List of ConnectionResult objects for each connection attempt
+    """
+    results: list[ConnectionResult | None] = [None] * (len(hosts) * len(ports))
+    await _run_connections(hosts, ports, time_limit, max_concurrency, results.__setitem__)
+    # _run_connections stores a result at every index or raises, so no None is left
+    return cast("list[ConnectionResult]", results)
+
+
+async def test_connections_columns(
+    hosts: list[str], ports: list[int], time_limit: float, max_concurrency: int
+) -> ConnectionColumns:
+    """Test TCP connectivity like test_connections, storing results column by column.
+
+    Use this for very large scans, where one ConnectionResult per attempt would use
+    far more memory than the compact per-field arrays of ConnectionColumns.
+
+    Args:
+        hosts: List of hostnames or IP addresses to test
+        ports: List of TCP ports to test on each host
+        time_limit: Connection timeout in seconds
+        max_concurrency: Maximum number of concurrent connections
+
+    Returns:
+        ConnectionColumns holding every connection attempt in host-major order
+    """
+    columns = ConnectionColumns.allocate(len(hosts) * len(ports))
+    await _run_connections(hosts, ports, time_limit, max_concurrency, columns.store)
+    return columns
@@ -0,0 +1,165 @@
+"""Unit tests for the TCP connection testing module."""
+
+from __future__ import annotations
+
+from asyncio import sleep as asyncio_sleep
+from socket import gaierror as socket_gaierror
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from network_tools.tests import connect
+from network_tools.tests.connect import ConnectionColumns, ConnectionResult, try_connect
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Generator
+
+
+async def test_try_connect_success() -> None:
+    """Test a successful connection attempt closes the writer and reports success."""
+    writer = MagicMock()
+    writer.wait_closed = AsyncMock()
+
+    with patch("network_tools.tests.connect.asyncio_open_connection", return_value=(None, writer)):
+        result = await try_connect("192.0.2.1", 22, time_limit=1.0)
+
+    if not result.success or result.error is not None:
+        pytest.fail(f"Expected successful result, got: {result!r}")
+    if not writer.close.called:
+        pytest.fail("Writer was not closed after successful connection")
+
+
+@pytest.mark.parametrize(
+    ("exception", "expected_error"),
+    [
+        (TimeoutError(), "Connection timed out"),
+        (socket_gaierror("Name or service not known"), "DNS resolution error: Name or service not known"),
+        (ConnectionRefusedError("Connection refused"), "Connection refused"),
+        (ValueError("boom"), "Unexpected error: boom"),
+    ],
+)
+async def test_try_connect_failures(exception: Exception, expected_error: str) -> None:
+    """Test each failure path produces a tagged, unsuccessful result."""
+    with patch("network_tools.tests.connect.asyncio_open_connection", side_effect=exception):
+        result = await try_connect("192.0.2.1", 22, time_limit=1.0)
+
+    if result.success:
+        pytest.fail("Expected unsuccessful result")
+    if result.error != expected_error:
+        pytest.fail(f"Error mismatch.\nExpected: {expected_error!r}\nGot: {result.error!r}")
+    if result.time_ms < 0:
+        pytest.fail(f"Expected non-negative elapsed time, got: {result.time_ms}")
+
+
+def test_failure_helper() -> None:
+    """Test the failure helper fills in host, port and error."""
+    result = connect._failure("192.0.2.1", 23, connect.perf_counter(), "Connection timed out")
+
+    expected = ConnectionResult(
+        host="192.0.2.1", port=23, success=False, time_ms=result.time_ms, error="Connection timed out"
+    )
+    if result.as_dict() != expected.as_dict():
+        pytest.fail(f"Result mismatch.\nExpected: {expected.as_dict()!r}\nGot: {result.as_dict()!r}")
+
+
+@pytest.fixture
+def mock_progress() -> Generator[None]:
+    """Fixture silencing the progress bar used by connection testing."""
+    with (
+        patch("network_tools.tests.connect.create_progress", return_value="task"),
+        patch("network_tools.tests.connect.update_progress"),
+        patch("network_tools.tests.connect.complete_progress"),
+    ):
+        yield
+
+
+async def fake_try_connect(host: str, port: int, time_limit: float) -> ConnectionResult:
+    """Fake connection attempt that only succeeds on port 22."""
+    if port == 22:  # noqa: PLR2004
+        return ConnectionResult(host=host, port=port, success=True, time_ms=1.25)
+    return ConnectionResult(host=host, port=port, success=False, time_ms=2.5, error="Connection refused")
+
+
+@pytest.mark.usefixtures("mock_progress")
+async def test_connections_results_order() -> None:
+    """Test results come back in host-major order for every host/port pair."""
+    with patch("network_tools.tests.connect.try_connect", fake_try_connect):
+        results = await connect.test_connections(["a", "b"], [22, 23], time_limit=1.0, max_concurrency=2)
+
+    pairs = [(result.host, result.port) for result in results]
+    expected = [("a", 22), ("a", 23), ("b", 22), ("b", 23)]
+    if pairs != expected:
+        pytest.fail(f"Result order mismatch.\nExpected: {expected!r}\nGot: {pairs!r}")
+
+
+@pytest.mark.usefixtures("mock_progress")
+async def test_connections_columns() -> None:
+    """Test columnar results match the per-object results."""
+    with patch("network_tools.tests.connect.try_connect", fake_try_connect):
+        results = await connect.test_connections(["a", "b"], [22, 23], time_limit=1.0, max_concurrency=2)
+        columns = await connect.test_connections_columns(
+            ["a", "b"], [22, 23], time_limit=1.0, max_concurrency=2
+        )
+
+    if len(columns) != len(results):
+        pytest.fail(f"Expected {len(results)} results, got {len(columns)}")
+    if sum(columns.success) != 2:  # noqa: PLR2004
+        pytest.fail(f"Expected 2 successful results, got {sum(columns.success)}")
+    for index, result in enumerate(results):
+        if columns.as_dict(index) != result.as_dict():
+            pytest.fail(
+                f"Row {index} mismatch.\nExpected: {result.as_dict()!r}\nGot: {columns.as_dict(index)!r}"
+            )
+
+
+def test_connection_columns_keep_time_precision() -> None:
+    """Test a long attempt's time survives a round trip through the columns unchanged."""
+    result = ConnectionResult(host="a", port=65535, success=False, time_ms=200000.37, error="Timed out")
+    columns = ConnectionColumns.allocate(1)
+    columns.store(0, result)
+
+    if columns.as_dict(0) != result.as_dict():
+        pytest.fail(f"Round trip mismatch.\nExpected: {result.as_dict()!r}\nGot: {columns.as_dict(0)!r}")
+
+
+@pytest.mark.usefixtures("mock_progress")
+@pytest.mark.parametrize("run", [connect.test_connections, connect.test_connections_columns])
+async def test_connections_invalid_port(run: Callable[..., Awaitable[object]]) -> None:
+    """Test both result layouts reject an out of range port before any attempt starts."""
+    with (
+        patch("network_tools.tests.connect.try_connect", fake_try_connect),
+        pytest.raises(ValueError, match="Ports must be between 1 and 65535"),
+    ):
+        await run(["a"], [22, 65536], time_limit=1.0, max_concurrency=2)
+
+
+@pytest.mark.usefixtures("mock_progress")
+async def test_connections_concurrency_limit() -> None:
+    """Test max_concurrency attempts are in flight at once, and no more."""
+    active = peak = 0
+
+    async def slow_try_connect(host: str, port: int, time_limit: float) -> ConnectionResult:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio_sleep(0)
+        active -= 1
+        return ConnectionResult(host=host, port=port, success=True, time_ms=0.0)
+
+    with patch("network_tools.tests.connect.try_connect", slow_try_connect):
+        results = await connect.test_connections(
+            ["a", "b", "c"], [1, 2, 3, 4], time_limit=1.0, max_concurrency=3
+        )
+
+    if len(results) != 12:  # noqa: PLR2004
+        pytest.fail(f"Expected 12 results, got {len(results)}")
+    if peak != 3:  # noqa: PLR2004
+        pytest.fail(f"Expected exactly 3 concurrent attempts, got {peak}")
+
+
+@pytest.mark.usefixtures("mock_progress")
+async def test_connections_zero_concurrency() -> None:
+    """Test a max_concurrency below 1 is rejected instead of testing nothing."""
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        await connect.test_connections(["a"], [22], time_limit=1.0, max_concurrency=0)
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import threading
+from importlib import import_module
 from logging import getLogger
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, call, patch
 
@@ -11,7 +13,6 @@ import pytest
 
 from network_tools.cli.console import (
     LiveDisplayHandler,
-    _active_tasks,  # noqa: PLC2701
     complete_progress,
     create_progress,
     live_display,
@@ -24,31 +25,34 @@ from network_tools.cli.console import (
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from rich.progress import TaskID
+
 log = getLogger(__name__)
 
+# The console module itself, as network_tools.cli re-exports a Console named console
+console_module = import_module("network_tools.cli.console")
+
 
 @pytest.fixture(autouse=True)
-def reset_progress_state() -> Generator[None]:
-    """Reset progress-related global state between tests."""
-    original_active_tasks = _active_tasks.copy()
+def active_tasks(monkeypatch: pytest.MonkeyPatch) -> Generator[dict[str, TaskID]]:
+    """Give each test its own empty progress task registry.
 
-    # Clear active tasks before test
-    _active_tasks.clear()
+    The module-level dict is swapped for a fresh one and the original put back on
+    teardown, so the shared dict is never copied, cleared or refilled.
+    """
+    tasks: dict[str, TaskID] = {}
+    monkeypatch.setattr(console_module, "_active_tasks", tasks)
 
     # Ensure live display is stopped
     if live_display.is_started:
         live_display.stop()
 
-    yield
+    yield tasks
 
     # Clean up after test
     if live_display.is_started:
         live_display.stop()
 
-    # Restore original tasks
-    _active_tasks.clear()
-    _active_tasks.update(original_active_tasks)
-
 
 @pytest.fixture
 def mock_console() -> Generator[MagicMock]:
@@ -88,39 +92,37 @@ def test_progress_lock_is_rlock() -> None:
         pytest.fail(f"Expected progress_lock to be threading.RLock, got {type(progress_lock)}")
 
 
-def test_live_display_handler_emit_display_not_started(mock_console: MagicMock) -> None:
+def test_live_display_handler_emit_display_not_started(mock_console: MagicMock, mock_live: MagicMock) -> None:
     """Test LiveDisplayHandler.emit when live display is not started."""
-    with patch("network_tools.cli.console.live_display") as mock_live:
-        mock_live.is_started = False
+    mock_live.is_started = False
 
-        handler = LiveDisplayHandler(console=mock_console)
-        record = MagicMock()
-        rendered = MagicMock()
+    handler = LiveDisplayHandler(console=mock_console)
+    record = SimpleNamespace()
+    rendered = SimpleNamespace()
 
-        with patch.object(handler, "render", return_value=rendered) as mock_render:
-            handler.emit(record)
+    with patch.object(handler, "render", return_value=rendered) as mock_render:
+        handler.emit(record)
 
-            mock_render.assert_called_once_with(record)
-            mock_console.print.assert_called_once_with(rendered)
-            mock_live.refresh.assert_not_called()
+        mock_render.assert_called_once_with(record)
+        mock_console.print.assert_called_once_with(rendered)
+        mock_live.refresh.assert_not_called()
 
 
-def test_live_display_handler_emit_display_started(mock_console: MagicMock) -> None:
+def test_live_display_handler_emit_display_started(mock_console: MagicMock, mock_live: MagicMock) -> None:
     """Test LiveDisplayHandler.emit when live display is started."""
-    with patch("network_tools.cli.console.live_display") as mock_live:
-        mock_live.is_started = True
+    mock_live.is_started = True
 
-        handler = LiveDisplayHandler(console=mock_console)
-        record = MagicMock()
-        rendered = MagicMock()
+    handler = LiveDisplayHandler(console=mock_console)
+    record = SimpleNamespace()
+    rendered = SimpleNamespace()
 
-        with patch.object(handler, "render", return_value=rendered) as mock_render:
-            handler.emit(record)
+    with patch.object(handler, "render", return_value=rendered) as mock_render:
+        handler.emit(record)
 
-            mock_render.assert_called_once_with(record)
-            mock_console.print.assert_called_once_with(rendered)
-            if mock_live.refresh.call_count != 2:  # noqa: PLR2004
-                pytest.fail(f"Expected 2 refresh calls, got {mock_live.refresh.call_count}")
+        mock_render.assert_called_once_with(record)
+        mock_console.print.assert_called_once_with(rendered)
+        if mock_live.refresh.call_count != 2:  # noqa: PLR2004
+            pytest.fail(f"Expected 2 refresh calls, got {mock_live.refresh.call_count}")
 
 
 def test_start_live_display_not_started(mock_live: MagicMock) -> None:
@@ -152,20 +154,17 @@ def test_stop_live_display_started_no_tasks(mock_live: MagicMock) -> None:
     mock_live.stop.assert_called_once()
 
 
-def test_stop_live_display_started_with_tasks(mock_live: MagicMock) -> None:
+def test_stop_live_display_started_with_tasks(mock_live: MagicMock, active_tasks: dict[str, TaskID]) -> None:
     """Test stop_live_display when display is started but has active tasks."""
     mock_live.is_started = True
 
     # Add a mock task
-    _active_tasks["test_task"] = 1
+    active_tasks["test_task"] = 1
 
     stop_live_display()
 
     mock_live.stop.assert_not_called()
 
-    # Clean up
-    _active_tasks.clear()
-
 
 def test_stop_live_display_not_started(mock_live: MagicMock) -> None:
     """Test stop_live_display when display is not started."""
@@ -176,7 +175,9 @@ def test_stop_live_display_not_started(mock_live: MagicMock) -> None:
     mock_live.stop.assert_not_called()
 
 
-def test_create_progress_new_task(mock_progress: MagicMock, mock_live: MagicMock) -> None:
+def test_create_progress_new_task(
+    mock_progress: MagicMock, mock_live: MagicMock, active_tasks: dict[str, TaskID]
+) -> None:
     """Test create_progress with auto-generated task ID."""
     mock_progress.add_task.return_value = 123
     mock_live.is_started = True
@@ -191,12 +192,14 @@ def test_create_progress_new_task(mock_progress: MagicMock, mock_live: MagicMock
     mock_progress.add_task.assert_called_once_with(description, total=total)
     if task_id != "task_1000.0":
         pytest.fail(f"Expected task ID 'task_1000.0', got {task_id}")
-    if _active_tasks[task_id] != 123:  # noqa: PLR2004
-        pytest.fail(f"Expected task ID {task_id} to have value 123, got {_active_tasks[task_id]}")
+    if active_tasks[task_id] != 123:  # noqa: PLR2004
+        pytest.fail(f"Expected task ID {task_id} to have value 123, got {active_tasks[task_id]}")
     mock_live.refresh.assert_called_once()
 
 
-def test_create_progress_custom_task_id(mock_progress: MagicMock, mock_live: MagicMock) -> None:
+def test_create_progress_custom_task_id(
+    mock_progress: MagicMock, mock_live: MagicMock, active_tasks: dict[str, TaskID]
+) -> None:
     """Test create_progress with custom task ID."""
     mock_progress.add_task.return_value = 123
     mock_live.is_started = True
@@ -210,12 +213,14 @@ def test_create_progress_custom_task_id(mock_progress: MagicMock, mock_live: Mag
     mock_progress.add_task.assert_called_once_with(description, total=total)
     if returned_task_id != task_id:
         pytest.fail(f"Expected task ID {task_id}, got {returned_task_id}")
-    if _active_tasks[task_id] != 123:  # noqa: PLR2004
-        pytest.fail(f"Expected task ID {task_id} to have value 123, got {_active_tasks[task_id]}")
+    if active_tasks[task_id] != 123:  # noqa: PLR2004
+        pytest.fail(f"Expected task ID {task_id} to have value 123, got {active_tasks[task_id]}")
     mock_live.refresh.assert_called_once()
 
 
-def test_create_progress_starts_display(mock_progress: MagicMock, mock_live: MagicMock) -> None:
+def test_create_progress_starts_display(
+    mock_progress: MagicMock, mock_live: MagicMock, active_tasks: dict[str, TaskID]
+) -> None:
     """Test create_progress starts live display if not already started."""
     mock_progress.add_task.return_value = 123
     mock_live.is_started = False
@@ -225,17 +230,19 @@ def test_create_progress_starts_display(mock_progress: MagicMock, mock_live: Mag
     task_id = create_progress(description)
 
     mock_live.start.assert_called_once()
-    if task_id not in _active_tasks:
+    if task_id not in active_tasks:
         pytest.fail(f"Task {task_id} should be in _active_tasks")
     mock_live.refresh.assert_called_once()
 
 
-def test_update_progress_advance(mock_progress: MagicMock, mock_live: MagicMock) -> None:
+def test_update_progress_advance(
+    mock_progress: MagicMock, mock_live: MagicMock, active_tasks: dict[str, TaskID]
+) -> None:
     """Test update_progress with advance parameter."""
     mock_live.is_started = True
     task_id = "test_task"
     progress_task_id = 123
-    _active_tasks[task_id] = progress_task_id
+    active_tasks[task_id] = progress_task_id
 
     update_progress(task_id, advance=10)
 
@@ -243,12 +250,14 @@ def test_update_progress_advance(mock_progress: MagicMock, mock_live: MagicMock)
     mock_live.refresh.assert_called_once()
 
 
-def test_update_progress_completed(mock_progress: MagicMock, mock_live: MagicMock) -> None:
+def test_update_progress_completed(
+    mock_progress: MagicMock, mock_live: MagicMock, active_tasks: dict[str, TaskID]
+) -> None:
     """Test update_progress with completed parameter."""
     mock_live.is_started = True
     task_id = "test_task"
     progress_task_id = 123
-    _active_tasks[task_id] = progress_task_id
+    active_tasks[task_id] = progress_task_id
 
     update_progress(task_id, completed=50)
 
@@ -256,13 +265,15 @@ def test_update_progress_completed(mock_progress: MagicMock, mock_live: MagicMoc
     mock_live.refresh.assert_called_once()
 
 
-def test_update_progress_description(mock_progress: MagicMock, mock_live: MagicMock) -> None:
+def test_update_progress_description(
+    mock_progress: MagicMock, mock_live: MagicMock, active_tasks: dict[str, TaskID]
+) -> None:
     """Test update_progress with description parameter."""
     mock_live.is_started = True
     task_id = "test_task"
     progress_task_id = 123
     description = "Updated description"
-    _active_tasks[task_id] = progress_task_id
+    active_tasks[task_id] = progress_task_id
 
     update_progress(task_id, description=description)
 
@@ -270,13 +281,15 @@ def test_update_progress_description(mock_progress: MagicMock, mock_live: MagicM
     mock_live.refresh.assert_called_once()
 
 
-def test_update_progress_multiple_params(mock_progress: MagicMock, mock_live: MagicMock) -> None:
+def test_update_progress_multiple_params(
+    mock_progress: MagicMock, mock_live: MagicMock, active_tasks: dict[str, TaskID]
+) -> None:
     """Test update_progress with multiple parameters."""
     mock_live.is_started = True
     task_id = "test_task"
     progress_task_id = 123
     description = "Updated description"
-    _active_tasks[task_id] = progress_task_id
+    active_tasks[task_id] = progress_task_id
 
     update_progress(task_id, advance=10, description=description, visible=True)
 
@@ -299,12 +312,14 @@ def test_update_progress_nonexistent_task(mock_progress: MagicMock, mock_log: Ma
     mock_log.warning.assert_called_with("Attempted to update non-existent progress task: %s", task_id)
 
 
-def test_update_progress_display_not_started(mock_progress: MagicMock, mock_live: MagicMock) -> None:
+def test_update_progress_display_not_started(
+    mock_progress: MagicMock, mock_live: MagicMock, active_tasks: dict[str, TaskID]
+) -> None:
     """Test update_progress when live display is not started."""
     mock_live.is_started = False
     task_id = "test_task"
     progress_task_id = 123
-    _active_tasks[task_id] = progress_task_id
+    active_tasks[task_id] = progress_task_id
 
     update_progress(task_id, advance=10)
 
@@ -312,16 +327,17 @@ def test_update_progress_display_not_started(mock_progress: MagicMock, mock_live
     mock_live.refresh.assert_not_called()
 
 
-def test_complete_progress(mock_progress: MagicMock, mock_live: MagicMock) -> None:
+def test_complete_progress(
+    mock_progress: MagicMock, mock_live: MagicMock, active_tasks: dict[str, TaskID]
+) -> None:
     """Test complete_progress basic functionality."""
     mock_live.is_started = True
     task_id = "test_task"
     progress_task_id = 123
-    _active_tasks[task_id] = progress_task_id
+    active_tasks[task_id] = progress_task_id
 
     # Mock the task object
-    task = MagicMock()
-    task.total = 100
+    task = SimpleNamespace(total=100)
     mock_progress.tasks = {progress_task_id: task}
 
     complete_progress(task_id)
@@ -330,24 +346,25 @@ def test_complete_progress(mock_progress: MagicMock, mock_live: MagicMock) -> No
     mock_progress.update.assert_called_once_with(progress_task_id, completed=100)
 
     # Should be removed from active tasks
-    if task_id in _active_tasks:
+    if task_id in active_tasks:
         pytest.fail(f"Task {task_id} should not be in _active_tasks")
 
     # Should stop display if no active tasks
     mock_live.stop.assert_called_once()
 
 
-def test_complete_progress_with_description(mock_progress: MagicMock, mock_live: MagicMock) -> None:
+def test_complete_progress_with_description(
+    mock_progress: MagicMock, mock_live: MagicMock, active_tasks: dict[str, TaskID]
+) -> None:
     """Test complete_progress with description parameter."""
     mock_live.is_started = True
     task_id = "test_task"
     progress_task_id = 123
     description = "Completed!"
-    _active_tasks[task_id] = progress_task_id
+    active_tasks[task_id] = progress_task_id
 
     # Mock the task object
-    task = MagicMock()
-    task.total = 100
+    task = SimpleNamespace(total=100)
     mock_progress.tasks = {progress_task_id: task}
 
     complete_progress(task_id, description=description)
@@ -360,7 +377,7 @@ def test_complete_progress_with_description(mock_progress: MagicMock, mock_live:
     mock_progress.update.assert_has_calls(calls)
 
     # Should be removed from active tasks
-    if task_id in _active_tasks:
+    if task_id in active_tasks:
         pytest.fail(f"Task {task_id} should not be in _active_tasks")
 
 
@@ -377,19 +394,20 @@ def test_complete_progress_nonexistent_task(mock_progress: MagicMock, mock_log:
     mock_log.warning.assert_called_with("Attempted to complete non-existent progress task: %s", task_id)
 
 
-def test_complete_progress_with_other_tasks(mock_progress: MagicMock, mock_live: MagicMock) -> None:
+def test_complete_progress_with_other_tasks(
+    mock_progress: MagicMock, mock_live: MagicMock, active_tasks: dict[str, TaskID]
+) -> None:
     """Test complete_progress when other tasks are still active."""
     mock_live.is_started = True
     task_id1 = "test_task_1"
     task_id2 = "test_task_2"
     progress_task_id1 = 123
     progress_task_id2 = 456
-    _active_tasks[task_id1] = progress_task_id1
-    _active_tasks[task_id2] = progress_task_id2
+    active_tasks[task_id1] = progress_task_id1
+    active_tasks[task_id2] = progress_task_id2
 
     # Mock the task object
-    task = MagicMock()
-    task.total = 100
+    task = SimpleNamespace(total=100)
     mock_progress.tasks = {progress_task_id1: task}
 
     complete_progress(task_id1)
@@ -398,19 +416,20 @@ def test_complete_progress_with_other_tasks(mock_progress: MagicMock, mock_live:
     mock_live.stop.assert_not_called()
 
     # Only task_id1 should be removed
-    if task_id1 in _active_tasks:
+    if task_id1 in active_tasks:
         pytest.fail(f"Task {task_id1} should not be in _active_tasks")
-    if task_id2 not in _active_tasks:
+    if task_id2 not in active_tasks:
         pytest.fail(f"Task {task_id2} should be in _active_tasks")
 
 
-def test_integration_progress_workflow(mock_progress: MagicMock, mock_live: MagicMock) -> None:
+def test_integration_progress_workflow(
+    mock_progress: MagicMock, mock_live: MagicMock, active_tasks: dict[str, TaskID]
+) -> None:
     """Test an integration of the full progress workflow."""
     # Setup
     mock_live.is_started = False
     mock_progress.add_task.return_value = 123
-    task = MagicMock()
-    task.total = 100
+    task = SimpleNamespace(total=100)
     mock_progress.tasks = {123: task}
 
     # Patch stop_live_display to directly call mock_live.stop
@@ -439,7 +458,7 @@ def test_integration_progress_workflow(mock_progress: MagicMock, mock_live: Magi
         # Verify task completed and removed
         if mock_progress.update.call_count != 5:  # noqa: PLR2004
             pytest.fail(f"Expected 5 update calls, got {mock_progress.update.call_count}")
-        if task_id in _active_tasks:
+        if task_id in active_tasks:
             pytest.fail(f"Task {task_id} should not be in _active_tasks")
 
         # 4. Live display should be stopped
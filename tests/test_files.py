@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import re
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
@@ -13,6 +15,9 @@ from network_tools.cli.files import FileReader, FileWriter
 if TYPE_CHECKING:
     from pathlib import Path
 
+# Error raised by FileReader and FileWriter for unknown types, compiled once for reuse
+INVALID_TYPE_PATTERN = re.compile(r"Invalid file type: invalid")
+
 
 @pytest.fixture
 def temp_directory(tmp_path: Path) -> Path:
@@ -78,8 +83,7 @@ def test_file_reader_csv() -> None:
         mock_dict_reader.return_value = mock_csv_data
 
         # Create mock path
-        mock_path = MagicMock()
-        mock_path.read_text.return_value = csv_content
+        mock_path = SimpleNamespace(read_text=MagicMock(return_value=csv_content))
 
         # Create the reader which will use our mocked DictReader
         reader = FileReader(path=mock_path, type="csv")
@@ -101,8 +105,7 @@ def test_file_reader_json() -> None:
     json_content = json.dumps(json_data)
 
     # Mock path object and read_text
-    mock_path = MagicMock()
-    mock_path.read_text.return_value = json_content
+    mock_path = SimpleNamespace(read_text=MagicMock(return_value=json_content))
 
     # Create a reader
     reader = FileReader(path=mock_path, type="json")
@@ -114,9 +117,9 @@ def test_file_reader_json() -> None:
 
 def test_file_reader_invalid_type() -> None:
     """Test FileReader with an invalid file type."""
-    mock_path = MagicMock()
+    mock_path = SimpleNamespace()
 
-    with pytest.raises(ValueError, match="Invalid file type: invalid"):
+    with pytest.raises(ValueError, match=INVALID_TYPE_PATTERN):
         # Intentionally use an invalid type
         FileReader(path=mock_path, type="invalid")
 
@@ -129,7 +132,7 @@ def test_file_writer_csv() -> None:
     ]
 
     # Set up mocks
-    mock_path = MagicMock()
+    mock_path = SimpleNamespace()
     mock_writer = MagicMock()
 
     # Direct patching of the DictWriter constructor
@@ -154,7 +157,7 @@ def test_file_writer_json() -> None:
     ]
 
     # Set up path mock
-    mock_path = MagicMock()
+    mock_path = SimpleNamespace()
 
     # Mock the json_dump function
     with patch("network_tools.cli.files.json_dump") as mock_json_dump:
@@ -171,11 +174,8 @@ def test_file_writer_plain_list() -> None:
     list_data = ["line1", "line2", "line3"]
     expected_text = "line1\nline2\nline3"
 
-    # Set up path mock
-    mock_path = MagicMock()
-
-    # Specifically patch the write_text method on our mock_path instance
-    mock_path.write_text = MagicMock()
+    # Set up path mock, only write_text needs to record calls
+    mock_path = SimpleNamespace(write_text=MagicMock())
 
     # Create a FileWriter with plain type
     FileWriter(path=mock_path, type="plain", data=list_data)
@@ -195,8 +195,7 @@ def test_file_writer_plain_string() -> None:
     string_data = "single line of text"
 
     # Set up path mock and its write_text method
-    mock_path = MagicMock()
-    mock_path.write_text = MagicMock()
+    mock_path = SimpleNamespace(write_text=MagicMock())
 
     # Create a FileWriter with plain type
     FileWriter(path=mock_path, type="plain", data=string_data)
@@ -224,8 +223,7 @@ def test_file_writer_plain_dict() -> None:
     expected_text = "\n".join(expected_lines)
 
     # Set up path mock
-    mock_path = MagicMock()
-    mock_path.write_text = MagicMock()
+    mock_path = SimpleNamespace(write_text=MagicMock())
 
     # Create a FileWriter with plain type
     FileWriter(path=mock_path, type="plain", data=dict_data)
@@ -241,10 +239,10 @@ def test_file_writer_plain_dict() -> None:
 
 def test_file_writer_invalid_type() -> None:
     """Test FileWriter with an invalid file type."""
-    test_path = MagicMock()
+    test_path = SimpleNamespace()
     test_data = [{"host": "192.168.1.1", "port": "22"}]
 
-    with pytest.raises(ValueError, match="Invalid file type: invalid"):
+    with pytest.raises(ValueError, match=INVALID_TYPE_PATTERN):
         # Intentionally use an invalid type
         FileWriter(path=test_path, type="invalid", data=test_data)
 
@@ -297,8 +295,7 @@ def test_plain_text_integration() -> None:
     expected_text = "line1\nline2\nline3"
 
     # Create a mock path
-    mock_path = MagicMock()
-    mock_path.write_text = MagicMock()
+    mock_path = SimpleNamespace(write_text=MagicMock())
 
     # Create FileWriter with plain type directly
     FileWriter(path=mock_path, type="plain", data=list_data)
@@ -345,8 +342,7 @@ def test_plain_text_integration() -> None:
 def test_plain_text_non_string_data() -> None:
     """Test plain text writer with non-string data types."""
     # Test with an integer
-    mock_path = MagicMock()
-    mock_path.write_text = MagicMock()
+    mock_path = SimpleNamespace(write_text=MagicMock())
 
     # Create FileWriter with plain type and an integer
     integer_data = 42